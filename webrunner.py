@@ -1,19 +1,31 @@
+import atexit
+import contextlib
 import time
 import pytest
 import os
 import allure
 import datetime
+import functools
 import string
 import random
+import secrets
 import json
 import zipfile
+import shutil
 import base64
+import gzip
 import configparser
-import inspect
+import sys
+import types
+import weakref
 import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional, Any
 
 from allure_commons.types import AttachmentType
+from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException, NoSuchWindowException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as ec
@@ -23,6 +35,53 @@ from selenium.webdriver.common.keys import Keys
 import LoggerReports
 import Browser
 
+# orjson is optional; it parses JSON several times faster than the stdlib and both accept bytes.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, falling back to json.loads for what orjson rejects.
+
+    orjson refuses NaN/Infinity and integers wider than 64 bits, which the stdlib accepts, so the
+    fallback keeps the set of loadable files the same with or without orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+# Failed xpath flushes lock the INI file with flock on POSIX and msvcrt.locking on Windows.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# ijson is optional; without it WebRunner.json_items parses the whole document instead of streaming.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Paths resolved once at import, relative to the project root two levels above this module.
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+_SCREENSHOT_DIR = os.path.join(_ROOT_DIR, "failure_screenshots")
+os.makedirs(_SCREENSHOT_DIR, exist_ok=True)
+_FAILED_XPATHS_PATH = os.path.join(_ROOT_DIR, "test_data", "failed_xpaths.ini")
+
+# Set to True to also attach screenshots for successful steps; failures are always captured.
+ENABLE_SUCCESS_SCREENSHOTS = False
+
+# Uploads larger than this are fetched by the page from a loopback HTTP server instead of base64.
+_UPLOAD_URL_THRESHOLD = 2 * 1024 * 1024
+
+_PASSWORD_CHARS = string.ascii_letters + string.digits + string.punctuation
+
 
 # Helper for logging and allure
 def log_and_report(message: str, function_name: str, screenshot: bool = False, driver: Optional[Any] = None, trace: Optional[Any] = None, report: Optional[Any] = None) -> str:
@@ -44,12 +103,17 @@ def log_and_report(message: str, function_name: str, screenshot: bool = False, d
     """
     LoggerReports.logger.info(message)
     if report:
+        # `report` is usually the allure module itself, so a second allure.step would duplicate the step.
         report.step(message)
-        allure.step(message)
     if screenshot and driver:
         allure.step("Please find below the screenshot for the same:")
-        WebRunner().screenshot(driver, function_name, trace)
-        allure.attach(driver.get_screenshot_as_png(), name=message, attachment_type=AttachmentType.PNG)
+        try:
+            image_bytes, attachment_type = WebRunner._fast_screenshot_bytes(driver)
+        except Exception as e:
+            LoggerReports.logger.info(f"Failed to capture screenshot for {function_name}: {e}")
+            return message
+        WebRunner.screenshot(driver, function_name, trace, image_bytes=image_bytes, attachment_type=attachment_type)
+        allure.attach(image_bytes, name=message, attachment_type=attachment_type)
     return message
 
 
@@ -82,7 +146,43 @@ def log_step(step_name):
     return decorator
 
 
-by_map = {
+# Decorator for retrying transient WebDriver failures
+def retry(max_attempts=3, delay=0.5, retriable=(StaleElementReferenceException, ElementClickInterceptedException)):
+    """Decorator to retry a function on transient WebDriver errors with exponential backoff.
+
+    Usage:
+        @retry(max_attempts=3, delay=0.5)
+        def my_func(...):
+            ...
+
+    Only exceptions listed in `retriable` are retried; anything else, including NoSuchElementException
+    and TimeoutException, is re-raised immediately. Between attempts it sleeps delay * 2**attempt
+    plus up to 100ms of jitter. The last error is re-raised once max_attempts is exhausted.
+
+    Raises:
+        ValueError: If max_attempts is less than 1.
+    """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except retriable as e:
+                    if attempt == max_attempts - 1:
+                        raise
+                    LoggerReports.logger.info(f"RETRY {attempt + 1}/{max_attempts - 1}: {func.__name__} | {e}")
+                    time.sleep(delay * (2 ** attempt) + random.random() * 0.1)
+
+        return wrapper
+
+    return decorator
+
+
+# Read-only: locator mode keys are interned so lookups of interned modes compare by identity.
+by_map = types.MappingProxyType({sys.intern(key): by for key, by in {
     "xpath": By.XPATH,
     "css": By.CSS_SELECTOR,
     "id": By.ID,
@@ -91,24 +191,256 @@ by_map = {
     "link": By.LINK_TEXT,
     "partial": By.PARTIAL_LINK_TEXT,
     "class": By.CLASS_NAME
+}.items()})
+
+_SELECT_DISPATCH = {
+    "index": lambda select, value: select.select_by_index(int(value)),
+    "value": lambda select, value: select.select_by_value(value),
+    "visible_text": lambda select, value: select.select_by_visible_text(value)
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_by(mode):
+    """Return the By constant for a locator mode key (case-insensitive), defaulting to XPath."""
+    return by_map.get(sys.intern(mode.lower()), By.XPATH)
+
+
+@functools.lru_cache(maxsize=2048)
+def _locator_tuple(mode, value):
+    """Return a cached (By, value) locator tuple so repeated locators reuse one object."""
+    return _resolve_by(mode), value
+
+
+@functools.lru_cache(maxsize=256)
+def _presence_cond(by, value):
+    """Return a cached presence_of_element_located condition for a (by, value) locator."""
+    return ec.presence_of_element_located((by, value))
+
+
+# WebDriverWait objects are stateless between until() calls, so one per driver and timeout is reused.
+_wait_cache = weakref.WeakKeyDictionary()
+
+# Window handle lists cached per driver by WebRunner.switch_to_nth_window.
+_handles_cache = weakref.WeakKeyDictionary()
+
+# Pending ActionChains per driver, built by WebRunner.action and sent by WebRunner.flush_actions.
+_actions_cache = weakref.WeakKeyDictionary()
+
+
+# Failure screenshots are written to disk off the test thread; capturing stays on the caller.
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+
+
+def _write_screenshot(path, image_bytes):
+    """Write screenshot bytes to path (runs on `_SCREENSHOT_POOL`)."""
+    try:
+        with open(path, "wb") as file:
+            file.write(image_bytes)
+    except Exception as e:
+        LoggerReports.logger.info(f"Failed to write screenshot {path}: {e}")
+
+
+def _wait(driver, timeout):
+    """Return a cached WebDriverWait for the driver and timeout using WebRunner's polling settings."""
+    waits = _wait_cache.get(driver)
+    if waits is None:
+        waits = _wait_cache[driver] = {}
+    wait = waits.get(timeout)
+    if wait is None:
+        wait = waits[timeout] = WebDriverWait(driver, timeout, poll_frequency=WebRunner.POLL_FREQUENCY, ignored_exceptions=(NoSuchElementException,))
+    return wait
+
+
+def _file_mtime(path):
+    """Return the modification time of path, or None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _load_json(path, mtime):
+    """Parse a JSON file, cached per (path, mtime) so an unchanged file is only parsed once.
+
+    The returned object is shared between callers; copy it before mutating.
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _json_prefix_items(node, keys):
+    """Yield the values under an ijson-style prefix path ('item' walks into array elements)."""
+    if not keys:
+        yield node
+    elif keys[0] == "item" and isinstance(node, list):
+        for child in node:
+            yield from _json_prefix_items(child, keys[1:])
+    elif isinstance(node, dict) and keys[0] in node:
+        yield from _json_prefix_items(node[keys[0]], keys[1:])
+
+
+def _iter_files(directory):
+    """Yield a DirEntry for every file below directory, using os.scandir's cached type information.
+
+    Like os.walk, symlinked directories are not descended into while symlinked files are included.
+    """
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+# Token -> file path of uploads currently being served by `_upload_server`.
+_upload_files = {}
+
+
+class _UploadFileHandler(BaseHTTPRequestHandler):
+    """Serve files registered in `_upload_files` to the browser under their random token path."""
+
+    def _send_cors_headers(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Private-Network", "true")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._send_cors_headers()
+        self.end_headers()
+
+    def do_GET(self):
+        path = _upload_files.get(self.path.lstrip("/"))
+        if path is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self._send_cors_headers()
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.end_headers()
+        with open(path, "rb", buffering=1 << 20) as file:
+            shutil.copyfileobj(file, self.wfile, 1 << 20)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _upload_server():
+    """Start the loopback upload server on a free port in a daemon thread, once per process."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UploadFileHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="upload-server", daemon=True).start()
+    atexit.register(server.shutdown)
+    return server
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on path (created if missing) for the duration of the with block."""
+    with open(path, "a+b") as lock_file:
+        lock_file.seek(0)
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _import_module_from_file(module_name, path):
+    """Import a module from its file path once per process; used only for modules missing from sys.modules."""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=256)
+def _value_to_var(cls):
+    """Map each string class attribute value of cls to the first attribute name holding it."""
+    names = {}
+    for name, value in vars(cls).items():
+        if isinstance(value, str) and "__" not in name and "__" not in value:
+            names.setdefault(value, name)
+    return names
+
+
+def _flush_failed_xpaths_at_exit():
+    """Write failed xpaths still pending when the process exits without a tear_down (registered with atexit)."""
+    try:
+        WebRunner().flush_failed_xpaths()
+    except Exception as e:
+        LoggerReports.logger.info(f"Failed to flush failed xpaths: {e}")
+
+
+def _quit_pooled_drivers():
+    """Quit every browser still parked in the WebRunner session pool (registered with atexit)."""
+    for drivers in WebRunner._driver_pool.values():
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                LoggerReports.logger.info(f"Failed to quit pooled browser: {e}")
+    WebRunner._driver_pool.clear()
+    WebRunner._driver_pool_keys.clear()
+
+
+class _BrowserSetting:
+    """Class attribute whose value is read from Browser() on first access instead of at import.
+
+    The first lookup replaces the descriptor on the owning class with the plain value, so later
+    lookups are ordinary attribute reads.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = getattr(Browser(), self.name)
+        setattr(owner, self.name, value)
+        return value
+
+
 class WebRunner:
     """Collection of generic Selenium WebDriver helper methods used across UI tests.
 
     Attributes:
         timeout (int): default wait timeout taken from Browser().timeout.
+        screenshot_format (str): failure screenshot format taken from Browser().screenshot_format.
+        POLL_FREQUENCY (float): interval in seconds between WebDriverWait condition polls.
+
+    Instances only carry the `driver` set by open_browser/acquire, so no per-instance __dict__ is kept.
     """
-    timeout = Browser().timeout
+    __slots__ = ('driver',)
+    timeout = _BrowserSetting()
+    screenshot_format = _BrowserSetting()
+    POLL_FREQUENCY = 0.1
+    _failed_xpaths_pending = {}
+    _driver_pool = {}
+    _driver_pool_keys = weakref.WeakKeyDictionary()
+    _headless_sessions = set()
 
     # ---------------- Browser Setup ----------------
-    def open_browser(self, browser: str, trace):
+    def open_browser(self, browser: str, trace, fast_mode=False, block_assets=False):
         """Open a browser instance using the project's Browser helper.
 
         Parameters:
             browser (str): Browser name (e.g., 'chrome', 'firefox').
             trace: Logging/trace object passed to Browser.
+            fast_mode (bool): If True, launch the browser with image loading disabled.
+            block_assets (bool): If True, block images, web fonts and analytics requests.
 
         Returns:
             WebDriver: Selenium WebDriver instance on success.
@@ -116,20 +448,72 @@ class WebRunner:
         Raises:
             Exception: Re-raises exceptions from Browser().call_browser after logging.
         """
-        function_name = self.open_browser.__name__
+        function_name = "open_browser"
         test_start_timestamp = datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")
         log_and_report("Run started at | " + test_start_timestamp + " |", function_name)
 
         driver = None
         try:
-            driver = Browser().call_browser(browser, trace)
+            driver = Browser().call_browser(browser, trace, fast_mode=fast_mode, block_assets=block_assets)
             log_and_report(f"{browser} browser launched successfully", function_name, trace=trace)
         except Exception as e:
             log_and_report(f"{browser} browser launch failed", function_name, screenshot=True, driver=driver, trace=trace)
             raise
+        if "headless" in browser.lower():
+            WebRunner._headless_sessions.add(driver.session_id)
         self.driver = driver
         return self.driver
 
+    def acquire(self, browser: str, trace, fast_mode=False, block_assets=False):
+        """Return a warm browser from the session pool, launching a new one only when none is free.
+
+        Pooled sessions are keyed by the launch options, so a driver is only reused for the same
+        browser name and flags. Hand the driver back with `release` (or `tear_down(..., reuse=True)`);
+        only Chromium drivers are kept, others are quit on release.
+        """
+        key = (browser.strip().lower(), fast_mode, block_assets)
+        pooled = WebRunner._driver_pool.get(key)
+        if pooled:
+            self.driver = pooled.pop()
+            log_and_report(f"Reusing pooled {browser} browser", function_name="acquire", trace=trace)
+        else:
+            self.open_browser(browser, trace, fast_mode=fast_mode, block_assets=block_assets)
+        WebRunner._driver_pool_keys[self.driver] = key
+        return self.driver
+
+    def release(self, driver, trace, report):
+        """Reset a driver obtained from `acquire` and return it to the session pool.
+
+        Every window but the first is closed, then cookies, web storage and the HTTP cache are
+        cleared for all origins through CDP, cached window handles and pending actions are dropped
+        and the browser is left on about:blank. Only Chromium drivers can be reset across origins,
+        so other drivers (Firefox, Safari) and drivers not acquired from the pool are quit instead.
+        """
+        key = WebRunner._driver_pool_keys.get(driver)
+        if key is None or not hasattr(driver, "execute_cdp_cmd"):
+            WebRunner._driver_pool_keys.pop(driver, None)
+            WebRunner._headless_sessions.discard(driver.session_id)
+            driver.quit()
+            return
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.execute_script("window.sessionStorage.clear();")
+        except Exception as e:
+            pass  # storage is not accessible on every page (e.g. about:blank, file://)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.get("about:blank")
+        # The next test starts with fresh window handles and no queued actions.
+        _handles_cache.pop(driver, None)
+        _actions_cache.pop(driver, None)
+        WebRunner._driver_pool.setdefault(key, []).append(driver)
+        log_and_report("Browser returned to session pool", function_name="release", trace=trace)
+
     # ---------------- Navigation ----------------
     def navigate_to_url(self, driver, base_url: str, trace):
         """Navigate the provided driver to the given URL.
@@ -143,9 +527,9 @@ class WebRunner:
         """
         try:
             driver.get(base_url)
-            log_and_report(f"Navigated to {base_url} successfully", function_name=self.navigate_to_url.__name__)
+            log_and_report(f"Navigated to {base_url} successfully", function_name="navigate_to_url")
         except Exception as e:
-            log_and_report(f"Failed to navigate to {base_url}", function_name=self.navigate_to_url.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report(f"Failed to navigate to {base_url}", function_name="navigate_to_url", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     # ---------------- Element Actions ----------------
@@ -166,8 +550,7 @@ class WebRunner:
         On failure logs a screenshot and attaches info to report.
         """
         try:
-            WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
-            locator = driver.find_element(by_map.get(mode.lower(), By.XPATH), element_value)
+            locator = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), element_value))
             self.scroll_to_element(driver, locator, function_name, trace, report)
             log_and_report(f"Located element for {function_name}", function_name)
             return locator
@@ -188,14 +571,63 @@ class WebRunner:
             list[WebElement]: Found elements or empty list on failure.
         """
         try:
-            WebDriverWait(driver, self.timeout).until(ec.presence_of_all_elements_located((by_map.get(mode.lower(), By.XPATH), element_value)))
-            locators = driver.find_elements(by_map.get(mode.lower(), By.XPATH), element_value)
+            locators = _wait(driver, self.timeout).until(ec.presence_of_all_elements_located(_locator_tuple(mode, element_value)))
             log_and_report(f"Located elements list for {function_name}", function_name)
             return locators
         except Exception as e:
             log_and_report(f"Failed to locate elements list for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             return []
 
+    _ELEMENTS_BY_LOCATOR_JS = """
+    var useXpath = arguments[1];
+    return arguments[0].map(function (value) {
+        return useXpath
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+    });
+    """
+
+    def web_locators_multi(self, driver, element_values, function_name, trace, report, mode='xpath', timeout=None):
+        """Wait until every locator in a list matches an element and return the first match of each.
+
+        XPath and CSS locators are resolved in the page with one execute_script call per poll instead
+        of one WebDriver lookup per locator; other modes fall back to find_elements per locator.
+
+        Parameters:
+            driver (WebDriver): Selenium WebDriver instance.
+            element_values (list[str]): Locator strings of the given mode.
+            function_name (str): Caller name for logging.
+            trace, report: optional reporting objects.
+            mode (str): Locator mode key (e.g. 'xpath', 'css', 'id').
+            timeout (int|None): Seconds to wait for all locators; defaults to `timeout`.
+
+        Returns:
+            list[WebElement]: One element per locator, in the same order.
+        """
+        try:
+            values = list(element_values)
+            mode = mode.lower()
+
+            if mode in ("xpath", "css"):
+                use_xpath = mode == "xpath"
+
+                def all_present(d):
+                    elements = d.execute_script(self._ELEMENTS_BY_LOCATOR_JS, values, use_xpath)
+                    return elements if all(elements) else False
+            else:
+                by = _resolve_by(mode)
+
+                def all_present(d):
+                    elements = [next(iter(d.find_elements(by, value)), None) for value in values]
+                    return elements if all(elements) else False
+
+            locators = _wait(driver, timeout or self.timeout).until(all_present)
+            log_and_report(f"Located {len(locators)} elements for {function_name}", function_name)
+            return locators
+        except Exception as e:
+            log_and_report(f"Failed to locate all elements for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
     def javascript_click(self, driver, locator, function_name, trace, report):
         """Click an element using JavaScript execution.
 
@@ -215,16 +647,27 @@ class WebRunner:
             log_and_report(f"Failed to click element using JavaScript for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def click(self, driver, locator, function_name: str, trace, report):
+    _SCROLL_CLICK_JS = 'arguments[0].scrollIntoView({ behavior: "auto", block: "center", inline: "center" }); arguments[0].click();'
+
+    def click(self, driver, locator, function_name: str, trace, report, fast_click=False, prescroll=False):
         """Click an element using a safe wait-then-click pattern.
 
-        Tries to use an explicit wait for clickability first, otherwise falls back to element.click().
+        Tries to use an explicit wait for clickability first (WebDriver scrolls the element into view
+        as part of the click), otherwise scrolls it to the viewport centre and falls back to
+        element.click(). Pass prescroll=True to centre the element before the first attempt.
+        With fast_click=True the scroll and click are sent as one JavaScript call instead, skipping
+        Selenium's actionability checks; element.click() remains the fallback if the script fails.
         """
         try:
             try:
-                self.scroll_to_element(driver, locator, function_name, trace, report)
-                WebDriverWait(driver, self.timeout).until(ec.element_to_be_clickable(locator)).click()
+                if fast_click:
+                    driver.execute_script(self._SCROLL_CLICK_JS, locator)
+                else:
+                    if prescroll:
+                        self.scroll_to_element(driver, locator, function_name, trace, report)
+                    _wait(driver, self.timeout).until(ec.element_to_be_clickable(locator)).click()
             except Exception as e:
+                self.scroll_to_element(driver, locator, function_name, trace, report)
                 locator.click()
             log_and_report(f"Clicked element for {function_name}", function_name)
         except Exception as e:
@@ -237,22 +680,42 @@ class WebRunner:
         Parameters and error handling similar to `click` but will not fallback to direct click.
         """
         try:
-            WebDriverWait(driver, self.timeout).until(ec.element_to_be_clickable(locator)).click()
+            _wait(driver, self.timeout).until(ec.element_to_be_clickable(locator)).click()
             log_and_report(f"Clicked element for {function_name}", function_name)
         except Exception as e:
             log_and_report(f"Failed to click element for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def input_clear(self, driver, locator, input_value: str, function_name: str, trace, report):
+    # Empties an input through the native value setter (so framework value trackers such as React's
+    # notice the change) and fires the events that form libraries listen to.
+    _RESET_VALUE_JS = """
+    var el = arguments[0];
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, '');
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    el.dispatchEvent(new KeyboardEvent('keyup', { bubbles: true }));
+    """
+
+    def input_clear(self, driver, locator, input_value: str, function_name: str, trace, report, use_ctrl_a=False, prescroll=False):
         """Clear an input and type a new value robustly.
 
-        Clears the element and sends a series of BACKSPACE keys to ensure previous content removed before typing.
+        Empties the element with a single script call that also fires input/change/keyup events, falling
+        back to WebElement.clear() if the script fails. With use_ctrl_a=True the content is instead
+        removed with real CTRL+A and DELETE key presses, for forms that must receive key events.
+        Typing scrolls the element into view; pass prescroll=True to centre it beforehand.
         """
         try:
-            self.scroll_to_element(driver, locator, function_name, trace, report)
-            element = WebDriverWait(driver, self.timeout).until(ec.visibility_of(locator))
-            element.clear()
-            locator.send_keys([Keys.BACKSPACE] * 200)
+            if prescroll:
+                self.scroll_to_element(driver, locator, function_name, trace, report)
+            element = _wait(driver, self.timeout).until(ec.visibility_of(locator))
+            if use_ctrl_a:
+                element.send_keys(Keys.CONTROL + "a")
+                element.send_keys(Keys.DELETE)
+            else:
+                try:
+                    driver.execute_script(self._RESET_VALUE_JS, element)
+                except Exception as e:
+                    element.clear()
             element.send_keys(input_value)
             log_and_report(f"Input '{input_value}' in {function_name}", function_name)
         except Exception as e:
@@ -272,14 +735,16 @@ class WebRunner:
             log_and_report(f"Failed to input in {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def clear_value(self, driver, locator, function_name, trace, report):
+    def clear_value(self, driver, locator, function_name, trace, report, prescroll=False):
         """Clear the value of an input element using JS and WebElement.clear().
 
         This helps when normal clear() alone isn't sufficient due to framework behaviors.
+        WebElement.clear() scrolls the element into view; pass prescroll=True to centre it beforehand.
         """
         try:
-            self.scroll_to_element(driver, locator, function_name, trace, report)
-            element = WebDriverWait(driver, self.timeout).until(ec.visibility_of(locator))
+            if prescroll:
+                self.scroll_to_element(driver, locator, function_name, trace, report)
+            element = _wait(driver, self.timeout).until(ec.visibility_of(locator))
             driver.execute_script("arguments[0].value = '';", locator)
             element.clear()
             log_and_report(f"Cleared value in {function_name}", function_name)
@@ -295,7 +760,7 @@ class WebRunner:
             driver, element_value, mode, function_name, trace: same conventions as other helpers.
         """
         try:
-            locator = WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
+            locator = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), element_value))
             self.scroll_to_element(driver, locator, function_name, trace, allure)
             log_and_report(f"Waited for element in {function_name}", function_name)
         except Exception as e:
@@ -308,10 +773,10 @@ class WebRunner:
         Note: implementation tries to find element and call is_displayed, but returns a boolean variable
         that defaults to False. On exceptions, it logs and returns False.
         """
-        function_name = self.is_element_displayed.__name__
+        function_name = "is_element_displayed"
         is_displayed = False
         try:
-            is_displayed = driver.find_element(by_map.get(mode.lower(), By.XPATH), element_value)
+            is_displayed = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), element_value))
             self.scroll_to_element(driver, is_displayed, function_name, trace, report)
             is_displayed.is_displayed()
             log_and_report(f"Waited for element to display on the web page", function_name=function_name)
@@ -323,7 +788,7 @@ class WebRunner:
     def explicit_is_element_displayed(self, driver, element_value, function_name: str = '', trace='', report='', mode='xpath'):
         """Explicitly wait for presence of element and return the web element or None on failure."""
         try:
-            is_displayed = WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
+            is_displayed = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), element_value))
             self.scroll_to_element(driver, is_displayed, function_name, trace, report)
             log_and_report(f"Waited for element in {function_name}", function_name)
             return is_displayed
@@ -334,7 +799,7 @@ class WebRunner:
     def explicit_wait_presence_of_element_is_invisible(self, driver, element_value, mode, function_name, trace):
         """Wait until a given element becomes invisible on the page."""
         try:
-            WebDriverWait(driver, self.timeout).until(ec.invisibility_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
+            _wait(driver, self.timeout).until(ec.invisibility_of_element_located(_locator_tuple(mode, element_value)))
             log_and_report(f"Waited for element to be invisible in {function_name}", function_name)
         except Exception as e:
             log_and_report(f"Failed waiting for element to be invisible in {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
@@ -342,75 +807,119 @@ class WebRunner:
 
     def is_enabled(self, driver, locator):
         """Return a visible element (used as an 'is enabled' check)."""
-        return WebDriverWait(driver, self.timeout).until(ec.visibility_of_element_located(locator))
+        return _wait(driver, self.timeout).until(ec.visibility_of_element_located(locator))
 
     def is_visible_on_screen(self, driver, element_value, mode="xpath", wait_time=30):
-        """Temporarily reduce implicit wait and check element visibility within a short wait time.
+        """Check element visibility within a short wait time and scroll it into view.
 
         Returns True if visible, False otherwise.
         """
-        function_name = self.is_visible_on_screen.__name__
+        function_name = "is_visible_on_screen"
         try:
-            driver.implicitly_wait(1)
-            locator = WebDriverWait(driver, wait_time).until(ec.visibility_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
+            locator = _wait(driver, wait_time).until(ec.visibility_of_element_located(_locator_tuple(mode, element_value)))
             if locator: driver.execute_script('return arguments[0].scrollIntoView({ behavior: "auto", block: "center", inline: "center" });', locator)
-            driver.implicitly_wait(self.timeout)
-            log_and_report(f"Element is visible on screen", function_name=self.is_visible_on_screen.__name__)
+            log_and_report(f"Element is visible on screen", function_name="is_visible_on_screen")
             return True
         except Exception as e:
-            driver.implicitly_wait(self.timeout)
             return False
 
     def is_visible(self, driver, element_value, mode="xpath"):
-        """Check whether element is visible using an explicit wait; return True/False."""
+        """Check whether element is visible using an explicit wait; return True/False.
+
+        An absent element costs the full timeout; use `is_displayed_fast` for quick negative checks.
+        """
         try:
-            WebDriverWait(driver, self.timeout).until(ec.visibility_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
+            _wait(driver, self.timeout).until(ec.visibility_of_element_located(_locator_tuple(mode, element_value)))
             return True
         except Exception as e:
             return False
 
+    def is_present_fast(self, driver, element_value, mode="xpath"):
+        """Return True if the element is in the DOM right now, without waiting or polling."""
+        try:
+            return bool(driver.find_elements(_resolve_by(mode), element_value))
+        except Exception as e:
+            return False
+
+    def is_displayed_fast(self, driver, element_value, mode="xpath"):
+        """Return True if the element exists and is displayed right now, without waiting or polling."""
+        try:
+            elements = driver.find_elements(_resolve_by(mode), element_value)
+            return bool(elements) and elements[0].is_displayed()
+        except Exception as e:
+            return False
+
     # ---------------- Screenshot ----------------
-    def screenshot(self, driver, function_name: str, trace):
+    @staticmethod
+    def _fast_screenshot_bytes(driver):
+        """Capture the viewport in the configured `screenshot_format`.
+
+        With 'jpeg' on a Chromium driver the image is taken through CDP Page.captureScreenshot, which
+        encodes far faster than the default PNG. Any other driver or format, or a failing CDP call,
+        uses WebDriver's PNG screenshot.
+
+        Returns:
+            tuple: (bytes, AttachmentType) of the captured image.
+        """
+        if WebRunner.screenshot_format == "jpeg" and hasattr(driver, "execute_cdp_cmd"):
+            try:
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 75, "captureBeyondViewport": False})
+                return base64.b64decode(result["data"]), AttachmentType.JPG
+            except Exception as e:
+                pass
+        return driver.get_screenshot_as_png(), AttachmentType.PNG
+
+    @staticmethod
+    def screenshot(driver, function_name: str, trace, image_bytes=None, attachment_type=AttachmentType.PNG):
         """Capture a screenshot to the failure_screenshots folder and attach to allure.
 
+        The page is captured once on the calling thread (WebDriver is not thread-safe) and the same
+        bytes are attached; the file is written by a background thread, flushed at interpreter exit.
+
         Parameters:
             driver (WebDriver): Selenium WebDriver.
             function_name (str): Used as filename for screenshot.
             trace: trace/logger used for step logging.
+            image_bytes (bytes|None): Already captured image to store instead of capturing a new one.
+            attachment_type (AttachmentType): Format of image_bytes; ignored when capturing here.
+
+        Returns:
+            bytes|None: The image bytes, or None if the capture failed.
         """
         try:
-            screenshot_path = os.path.abspath(__file__ + "/../../../") + '/failure_screenshots/'
-            driver.save_screenshot(screenshot_path + function_name + ".png")
-            allure.attach(driver.get_screenshot_as_png(), name=function_name, attachment_type=AttachmentType.PNG)
+            if image_bytes is None:
+                image_bytes, attachment_type = WebRunner._fast_screenshot_bytes(driver)
+            _SCREENSHOT_POOL.submit(_write_screenshot, os.path.join(_SCREENSHOT_DIR, function_name + "." + attachment_type.extension), image_bytes)
+            allure.attach(image_bytes, name=function_name, attachment_type=attachment_type)
             # Use keyword arguments to match signature: message, function_name, screenshot=False, driver=None, trace=None
             log_and_report(f"Screenshot captured for {function_name}", function_name=function_name, trace=trace)
+            return image_bytes
         except Exception as e:
-            log_and_report(f"Failed to capture screenshot for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            # No screenshot here: retrying the capture that just failed would recurse.
+            log_and_report(f"Failed to capture screenshot for {function_name}", function_name, trace=trace)
+            return None
 
     # ---------------- Dropdown ----------------
     def select_dropdown(self, driver, locator, mode, value, function_name: str, trace, report):
         """Select an option from a <select> element by index, value or visible text.
 
-        Parameters mirror those used elsewhere in this helper class.
+        Parameters mirror those used elsewhere in this helper class. An unknown mode fails the test.
         """
         try:
-            select = Select(locator)
-            if mode == "index":
-                select.select_by_index(int(value))
-            elif mode == "value":
-                select.select_by_value(value)
-            elif mode == "visible_text":
-                select.select_by_visible_text(value)
+            select_option = _SELECT_DISPATCH.get(mode)
+            if select_option is None:
+                raise ValueError(f"Unknown select mode: {mode}")
+            select_option(Select(locator), value)
             log_and_report(f"Selected '{str(value)}' in dropdown for {function_name}", function_name)
         except Exception as e:
-            log_and_report(f"Failed to select dropdown for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            log_and_report(f"Failed to select dropdown for {function_name}: {e}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     # ---------------- Hover ----------------
     def hover_to(self, driver, locator, function_name: str, trace, report, mode="xpath"):
         """Move the mouse over the provided element using ActionChains."""
         try:
-            element = WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((by_map.get(mode.lower(), By.XPATH), locator)))
+            element = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), locator))
             ActionChains(driver).move_to_element(element).perform()
             log_and_report(f"Hovered to element for {function_name}", function_name)
         except Exception as e:
@@ -418,7 +927,8 @@ class WebRunner:
             pytest.fail()
 
     # ---------------- drag and drop ----------------
-    def drag_drop(self, driver, source, destination, function_name, trace, report):
+    @staticmethod
+    def drag_drop(driver, source, destination, function_name, trace, report):
         """Drag source element and drop onto destination element."""
         try:
             ActionChains(driver).drag_and_drop(source, destination).perform()
@@ -441,18 +951,182 @@ class WebRunner:
     def get_value(self, driver, element_value, attribute, function_name: str, trace, report, mode='xpath'):
         """Get the attribute value from an element located by the given locator string."""
         try:
-            WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((by_map.get(mode.lower(), By.XPATH), element_value)))
-            value = driver.find_element(by_map.get(mode.lower(), By.XPATH), element_value).get_attribute(attribute)
+            element = _wait(driver, self.timeout).until(_presence_cond(_resolve_by(mode), element_value))
+            value = element.get_attribute(attribute)
             log_and_report(f"Got value '{str(value)}' for {function_name}", function_name)
             return value
         except Exception as e:
             log_and_report(f"Failed to get value for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
+    # ---------------- Batch Queries ----------------
+    _BATCH_QUERY_JS = """
+    return (function (queries) {
+        function describe(el, attr) {
+            var data = {
+                text: el.innerText,
+                visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+                enabled: !el.disabled
+            };
+            if (attr && attr !== 'text') {
+                data[attr] = attr === 'value' ? el.value : el.getAttribute(attr);
+            }
+            return data;
+        }
+        return queries.map(function (q) {
+            var found = document.querySelectorAll(q.selector);
+            if (q.all) {
+                return Array.prototype.map.call(found, function (el) { return describe(el, q.attr); });
+            }
+            return found.length ? describe(found[0], q.attr) : null;
+        });
+    })(arguments[0]);
+    """
+
+    def batch_query(self, driver, queries, function_name, trace, report):
+        """Run several element lookups/reads in a single execute_script round-trip.
+
+        Parameters:
+            driver (WebDriver): Selenium WebDriver instance.
+            queries (list[dict]): Each dict holds a CSS 'selector', an optional 'attr' to read
+                (e.g. 'text', 'value', 'href') and an optional 'all' flag to return every match.
+            function_name (str): Caller name for logging.
+            trace, report: optional reporting objects.
+
+        Returns:
+            list: One entry per query, in order. Each entry is a dict with 'text', 'visible',
+            'enabled' (plus the requested attribute), None when nothing matched, or a list of
+            such dicts when 'all' is set.
+        """
+        try:
+            results = driver.execute_script(self._BATCH_QUERY_JS, queries)
+            log_and_report(f"Batch queried {len(queries)} locators for {function_name}", function_name)
+            return results
+        except Exception as e:
+            log_and_report(f"Failed to batch query locators for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    # Collects `nodes` from arguments[0]: a list of WebElements, or a selector evaluated as XPath
+    # when arguments[1] is true and as CSS otherwise.
+    _COLLECT_NODES_JS = """
+    var nodes = [];
+    if (Array.isArray(arguments[0])) {
+        nodes = arguments[0];
+    } else if (arguments[1]) {
+        var snapshot = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+    } else {
+        nodes = Array.prototype.slice.call(document.querySelectorAll(arguments[0]));
+    }
+    """
+    _TEXTS_BULK_JS = _COLLECT_NODES_JS + """
+    return nodes.map(function (e) { return e.innerText; });
+    """
+    _ELEMENTS_DATA_JS = _COLLECT_NODES_JS + """
+    var attrs = arguments[2];
+    return nodes.map(function (e) {
+        var data = { visible: !!e.offsetParent };
+        attrs.forEach(function (a) {
+            data[a] = a === 'text' ? e.innerText : (a === 'value' ? e.value : e.getAttribute(a));
+        });
+        return data;
+    });
+    """
+
+    def _page_query_args(self, driver, element_value, mode):
+        """Return the (target, use_xpath) script arguments for a locator.
+
+        XPath and CSS locators are resolved inside the page; other modes are located with
+        find_elements first and the element list is passed to the script instead.
+        """
+        mode = mode.lower()
+        if mode in ("xpath", "css"):
+            return element_value, mode == "xpath"
+        return driver.find_elements(_resolve_by(mode), element_value), False
+
+    def get_element_texts_bulk(self, driver, element_value, function_name, trace, report, mode='xpath'):
+        """Return the text of every element matching a locator in a single execute_script call.
+
+        Parameters:
+            driver (WebDriver): Selenium WebDriver instance.
+            element_value (str): Locator string.
+            function_name (str): Caller name for logging.
+            trace, report: optional reporting objects.
+            mode (str): 'xpath' or 'css' are resolved in the page; other modes locate the elements
+                first and read all their texts in one further script call.
+
+        Returns:
+            list[str]: Texts in document order (empty list when nothing matched).
+        """
+        try:
+            texts = driver.execute_script(self._TEXTS_BULK_JS, *self._page_query_args(driver, element_value, mode))
+            log_and_report(f"Got {len(texts)} texts for {function_name}", function_name)
+            return texts
+        except Exception as e:
+            log_and_report(f"Failed to get texts for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    def find_elements_with_data(self, driver, element_value, function_name, trace, report, mode='xpath', attrs=("text", "value")):
+        """Locate all matching elements and read the requested data from each in one script call.
+
+        Parameters:
+            driver (WebDriver): Selenium WebDriver instance.
+            element_value (str): Locator string.
+            function_name (str): Caller name for logging.
+            trace, report: optional reporting objects.
+            mode (str): Locator mode key; see `get_element_texts_bulk` for how modes are resolved.
+            attrs (tuple[str]): Data to read per element. 'text' reads innerText, 'value' reads the
+                live value property and any other name is read with getAttribute.
+
+        Returns:
+            list[dict]: One dict per element with the requested keys plus 'visible'.
+        """
+        try:
+            target, use_xpath = self._page_query_args(driver, element_value, mode)
+            data = driver.execute_script(self._ELEMENTS_DATA_JS, target, use_xpath, list(attrs))
+            log_and_report(f"Got data for {len(data)} elements for {function_name}", function_name)
+            return data
+        except Exception as e:
+            log_and_report(f"Failed to get elements data for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    # Defines elementText(e), which reads text the way WebElement.text reports it: trimmed, and empty
+    # for hidden elements.
+    _ELEMENT_TEXT_FN_JS = """
+    function elementText(e) {
+        var visible = !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+        return visible ? (e.innerText || '').trim() : '';
+    }
+    """
+    _ELEMENT_TEXTS_JS = _ELEMENT_TEXT_FN_JS + """
+    return arguments[0].map(elementText);
+    """
+
+    def get_texts_batch(self, driver, locators, function_name, trace, report):
+        """Return the visible text of several WebElements with one execute_script round-trip.
+
+        Texts are trimmed and empty for hidden elements, matching WebElement.text.
+        """
+        try:
+            texts = driver.execute_script(self._ELEMENT_TEXTS_JS, list(locators))
+            log_and_report(f"Got {len(texts)} texts for {function_name}", function_name)
+            return texts
+        except Exception as e:
+            log_and_report(f"Failed to get texts for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
     def assert_element_text(self, driver, locator, element_text, function_name: str, trace, report):
-        """Assert that a WebElement's text equals the expected text and fail the test on mismatch."""
+        """Assert that a WebElement's text equals the expected text and fail the test on mismatch.
+
+        A list of WebElements may be passed with a matching list of expected texts; all texts are
+        then read in a single round-trip, trimmed and empty for hidden elements like WebElement.text.
+        """
         try:
-            actual_text = locator.text
+            if isinstance(locator, (list, tuple)):
+                actual_text = driver.execute_script(self._ELEMENT_TEXTS_JS, list(locator))
+                element_text = list(element_text)
+            else:
+                actual_text = locator.text
             assert actual_text == element_text, log_and_report(f"Text mismatch: Expected '{element_text}', Found '{actual_text}'", function_name)
             log_and_report(f"Asserted text '{str(element_text)}' for {function_name}", function_name)
         except AssertionError as ae:
@@ -462,17 +1136,55 @@ class WebRunner:
             log_and_report(f"Failed to assert text for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
+    _TEXTS_BY_LOCATOR_JS = _ELEMENT_TEXT_FN_JS + """
+    var useXpath = arguments[1];
+    return arguments[0].map(function (value) {
+        var el = useXpath
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+        return el ? elementText(el) : null;
+    });
+    """
+
+    def assert_texts_batch(self, driver, element_values, expected_texts, function_name, trace, report, mode='xpath'):
+        """Assert the texts of several located elements in one round-trip and fail on any mismatch.
+
+        Parameters:
+            element_values (list[str]): XPath (or CSS when mode='css') locators, one per element.
+            expected_texts (list[str]): Expected text for each locator, in the same order.
+
+        Texts are compared as WebElement.text reports them (trimmed, empty for hidden elements) in
+        every mode. A locator that matches nothing reads as None and is reported as a mismatch.
+        """
+        try:
+            mode = mode.lower()
+            if mode in ("xpath", "css"):
+                actual_texts = driver.execute_script(self._TEXTS_BY_LOCATOR_JS, list(element_values), mode == "xpath")
+            else:
+                elements = [driver.find_elements(_resolve_by(mode), value) for value in element_values]
+                actual_texts = [found[0].text if found else None for found in elements]
+            mismatches = [f"'{value}': expected '{expected}', found '{actual}'" for value, expected, actual in zip(element_values, expected_texts, actual_texts) if expected != actual]
+            assert len(actual_texts) == len(expected_texts) and not mismatches, log_and_report(f"Text mismatch: {'; '.join(mismatches) or 'locator/expected count differs'}", function_name)
+            log_and_report(f"Asserted {len(expected_texts)} texts for {function_name}", function_name)
+        except AssertionError as ae:
+            log_and_report(f"Assertion failed for {function_name}: {ae}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+        except Exception as e:
+            log_and_report(f"Failed to assert texts for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
     def explicit_assert_element_text(self, driver, element_value, element_text, function_name, trace, report):
         """Explicitly wait for an element then assert its text; supports dynamic placeholder.
 
         If element_text is None or 'dynamic', asserts the text is not "--".
         """
         try:
-            web_element = WebDriverWait(driver, self.timeout).until(ec.presence_of_element_located((By.XPATH, element_value)))
-            if element_text is None or element_text is 'dynamic':
-                assert web_element.text != "--", log_and_report(f"Text mismatch: Expected '{element_text}', Found '{web_element.text}'", function_name)
+            web_element = _wait(driver, self.timeout).until(_presence_cond(By.XPATH, element_value))
+            actual_text = web_element.text
+            if element_text is None or element_text == 'dynamic':
+                assert actual_text != "--", log_and_report(f"Text mismatch: Expected '{element_text}', Found '{actual_text}'", function_name)
             else:
-                assert web_element.text == element_text, log_and_report(f"Text mismatch: Expected '{element_text}', Found '{web_element.text}'", function_name)
+                assert actual_text == element_text, log_and_report(f"Text mismatch: Expected '{element_text}', Found '{actual_text}'", function_name)
 
             log_and_report(f"Asserted text '{str(element_text)}' for {function_name}", function_name)
         except AssertionError as ae:
@@ -483,34 +1195,57 @@ class WebRunner:
             pytest.fail()
 
     # ---------------- Tear Down ----------------
-    def tear_down(self, driver, trace, report):
-        """Quit the browser and log the result. Fails the test if quit fails."""
+    def tear_down(self, driver, trace, report, reuse=False):
+        """Flush stored failed xpaths and queued actions, quit the browser and log the result.
+
+        Fails the test if quit fails. With reuse=True the driver is handed to `release` and kept
+        warm for the next `acquire` instead of being quit; pooled drivers are quit when the process
+        exits. A failure to write the failed xpaths or to perform actions queued with `action` is
+        only logged so it never keeps the browser open.
+        """
         try:
+            self.flush_failed_xpaths()
+        except Exception as e:
+            log_and_report(f"Failed to flush failed xpaths: {e}", function_name="tear_down", trace=trace)
+        actions = _actions_cache.pop(driver, None)
+        if actions is not None:
+            try:
+                actions.perform()
+                log_and_report("Performed queued actions", function_name="tear_down")
+            except Exception as e:
+                log_and_report(f"Failed to perform queued actions: {e}", function_name="tear_down", trace=trace)
+        try:
+            if reuse:
+                self.release(driver, trace, report)
+                return
+            WebRunner._headless_sessions.discard(driver.session_id)
             driver.quit()
-            log_and_report("Browser closed successfully", function_name=self.tear_down.__name__)
+            log_and_report("Browser closed successfully", function_name="tear_down")
         except Exception as e:
-            log_and_report("Failed to close browser", function_name=self.tear_down.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report("Failed to close browser", function_name="tear_down", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def close_all_windows_except_current(self, driver, trace, report):
         """Close all browser windows except the current one using window handles."""
         try:
             current = driver.current_window_handle
-            for window in driver.window_handles:
-                if window != current:
-                    driver.switch_to.window(window)
-                    driver.close()
-
-            driver.switch_to.window(current)
-            log_and_report("Closed all windows except current window", function_name=self.close_all_windows_except_current.__name__, screenshot=True, driver=driver, trace=trace)
+            others = [window for window in driver.window_handles if window != current]
+            for window in others:
+                driver.switch_to.window(window)
+                driver.close()
+
+            if others:
+                driver.switch_to.window(current)
+            _handles_cache.pop(driver, None)
+            log_and_report("Closed all windows except current window", function_name="close_all_windows_except_current", screenshot=ENABLE_SUCCESS_SCREENSHOTS, driver=driver, trace=trace)
         except Exception as e:
-            log_and_report("Failed to close all windows except current", function_name=self.close_all_windows_except_current.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report("Failed to close all windows except current", function_name="close_all_windows_except_current", screenshot=True, driver=driver, trace=trace)
 
     # ---------------- Alerts ----------------
     def confirm_alert(self, driver, function_name, trace, report):
         """Wait for an alert to be present and accept it."""
         try:
-            WebDriverWait(driver, self.timeout).until(ec.alert_is_present())
+            _wait(driver, self.timeout).until(ec.alert_is_present())
             alert = driver.switch_to.alert
             alert.accept()
             log_and_report(f"Confirmed alert for {function_name}", function_name)
@@ -522,41 +1257,40 @@ class WebRunner:
     def find_frame_by_id(self, driver, frame_id, trace, report):
         """Wait for a frame to be available by id and switch to it."""
         try:
-            WebDriverWait(driver, self.timeout).until(ec.frame_to_be_available_and_switch_to_it((By.ID, frame_id)))
-            log_and_report(f"Switched to frame with ID: {frame_id}", function_name=self.find_frame_by_id.__name__)
+            _wait(driver, self.timeout).until(ec.frame_to_be_available_and_switch_to_it((By.ID, frame_id)))
+            log_and_report(f"Switched to frame with ID: {frame_id}", function_name="find_frame_by_id")
         except Exception as e:
-            log_and_report(f"Failed to switch to frame with ID: {frame_id}", function_name=self.find_frame_by_id.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report(f"Failed to switch to frame with ID: {frame_id}", function_name="find_frame_by_id", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def find_frame_by_name(self, driver, frame_name, trace, report):
         """Wait for a frame to be available by name and switch to it."""
         try:
-            WebDriverWait(driver, self.timeout).until(ec.frame_to_be_available_and_switch_to_it((By.NAME, frame_name)))
-            log_and_report(f"Switched to frame with Name: {frame_name}", function_name=self.find_frame_by_name.__name__)
+            _wait(driver, self.timeout).until(ec.frame_to_be_available_and_switch_to_it((By.NAME, frame_name)))
+            log_and_report(f"Switched to frame with Name: {frame_name}", function_name="find_frame_by_name")
         except Exception as e:
-            log_and_report(f"Failed to switch to frame with Name: {frame_name}", function_name=self.find_frame_by_name.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report(f"Failed to switch to frame with Name: {frame_name}", function_name="find_frame_by_name", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def switch_previous_window(self, driver, trace, report):
         """Switch to the previous window in the window_handles list."""
         try:
-            windows_count = len(driver.window_handles)
-            previous_window = driver.window_handles[windows_count - 2]
+            handles = driver.window_handles
+            previous_window = handles[len(handles) - 2]
             driver.switch_to.window(previous_window)
-            log_and_report("Switched to previous window", function_name=self.switch_previous_window.__name__)
+            log_and_report("Switched to previous window", function_name="switch_previous_window")
         except Exception as e:
-            log_and_report("Failed to switch to previous window", function_name=self.switch_previous_window.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report("Failed to switch to previous window", function_name="switch_previous_window", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def switch_next_window(self, driver, trace, report):
         """Switch to the most recently opened window."""
         try:
-            windows_count = len(driver.window_handles)
-            next_window = driver.window_handles[windows_count - 1]
+            next_window = driver.window_handles[-1]
             driver.switch_to.window(next_window)
-            log_and_report("Switched to next window", function_name=self.switch_next_window.__name__)
+            log_and_report("Switched to next window", function_name="switch_next_window")
         except Exception as e:
-            log_and_report("Failed to switch to next window", function_name=self.switch_next_window.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report("Failed to switch to next window", function_name="switch_next_window", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def switch_first_window(self, driver, trace, report):
@@ -564,9 +1298,9 @@ class WebRunner:
         try:
             first_window = driver.window_handles[1]
             driver.switch_to.window(first_window)
-            log_and_report("Switched to first window", function_name=self.switch_first_window.__name__)
+            log_and_report("Switched to first window", function_name="switch_first_window")
         except Exception as e:
-            log_and_report("Failed to switch to first window", function_name=self.switch_first_window.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report("Failed to switch to first window", function_name="switch_first_window", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     def switch_second_window(self, driver, trace, report):
@@ -574,38 +1308,66 @@ class WebRunner:
         try:
             second_window = driver.window_handles[2]
             driver.switch_to.window(second_window)
-            log_and_report("Switched to second window", function_name=self.switch_second_window.__name__)
+            log_and_report("Switched to second window", function_name="switch_second_window")
+        except Exception as e:
+            log_and_report("Failed to switch to second window", function_name="switch_second_window", screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    def switch_to_nth_window(self, driver, index, trace, report, refresh=False):
+        """Switch to the window at `index` in window_handles; negative indexes count from the end.
+
+        The handle list is cached per driver so repeated switches within a step cost one round-trip
+        each. It is re-fetched for negative indexes (a newly opened window changes what they point
+        to), when refresh=True, when index is out of range of the cached list or when the cached
+        handle no longer exists. Pass refresh=True after an action that opened a window if a
+        non-negative index may already be in range.
+        """
+        try:
+            handles = None if refresh or index < 0 else _handles_cache.get(driver)
+            if handles is None or not -len(handles) <= index < len(handles):
+                handles = _handles_cache[driver] = driver.window_handles
+            try:
+                driver.switch_to.window(handles[index])
+            except NoSuchWindowException:
+                handles = _handles_cache[driver] = driver.window_handles
+                driver.switch_to.window(handles[index])
+            log_and_report(f"Switched to window {index}", function_name="switch_to_nth_window")
         except Exception as e:
-            log_and_report("Failed to switch to second window", function_name=self.switch_second_window.__name__, screenshot=True, driver=driver, trace=trace)
+            log_and_report(f"Failed to switch to window {index}", function_name="switch_to_nth_window", screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
     # ---------------- General ----------------
-    def genearte_word(self, driver, prefix, function_name, trace, report):
+    def generate_word(self, driver, prefix, function_name, trace, report):
         """Generate a timestamped 'word' value using the provided prefix.
 
-        Returns a string combining the prefix and current datetime formatted.
+        Returns a string combining the prefix and current local time formatted as '%m/%d,%H:%M:%S'.
         """
         try:
-            word = prefix + datetime.datetime.now().strftime("%m/%d,%H:%M:%S")
+            word = prefix + time.strftime("%m/%d,%H:%M:%S", time.localtime())
             log_and_report(f"Generated word '{str(word)}' for {function_name}", function_name)
             return word
         except Exception as e:
             log_and_report(f"Failed to generate word for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def generate_password(self, driver, length, function_name, trace, report):
+    # Original misspelled name, kept for existing callers.
+    genearte_word = generate_word
+
+    def generate_password(self, driver, length, function_name, trace, report, secure=False):
         """Return a randomly generated password of given length using a broad character set.
 
         Parameters:
             length (int): Desired password length.
+            secure (bool): If True, draw characters with the `secrets` module instead of `random`.
 
         Returns:
             str: Randomly generated password.
         """
         try:
-            letters = string.ascii_lowercase + string.ascii_uppercase + string.ascii_letters + string.punctuation + string.digits
-            log_and_report(f"Successfully generated password for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
-            return ''.join(random.choice(letters) for i in range(length))
+            log_and_report(f"Successfully generated password for {function_name}", function_name, screenshot=ENABLE_SUCCESS_SCREENSHOTS, driver=driver, trace=trace)
+            if secure:
+                return ''.join(secrets.choice(_PASSWORD_CHARS) for _ in range(length))
+            return ''.join(random.choices(_PASSWORD_CHARS, k=length))
         except Exception as e:
             log_and_report(f"Failed to generate password for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
@@ -619,27 +1381,73 @@ class WebRunner:
             log_and_report(f"Failed to press ENTER key for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def press_esc_key(self, driver, function_name, trace, report):
-        """Send ESCAPE key to the current browser using ActionChains."""
+    def action(self, driver):
+        """Return the shared pending ActionChains for this driver, creating it when none is queued.
+
+        Actions appended here are sent together, in one W3C Actions request, by `flush_actions`.
+        """
+        actions = _actions_cache.get(driver)
+        if actions is None:
+            actions = _actions_cache[driver] = ActionChains(driver)
+        return actions
+
+    def flush_actions(self, driver, function_name="flush_actions", trace=None, report=None):
+        """Perform every action queued with `action` (or a defer=True helper) and start a new chain.
+
+        Pending actions that were never flushed are performed by `tear_down` before the browser closes.
+        """
+        actions = _actions_cache.pop(driver, None)
+        if actions is None:
+            return
+        try:
+            actions.perform()
+            log_and_report(f"Performed queued actions for {function_name}", function_name)
+        except Exception as e:
+            log_and_report(f"Failed to perform queued actions for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    def press_esc_key(self, driver, function_name, trace, report, defer=False):
+        """Send ESCAPE key to the current browser using ActionChains.
+
+        With defer=True the key press is queued on the shared chain and sent by `flush_actions`.
+        """
         try:
+            if defer:
+                self.action(driver).send_keys(Keys.ESCAPE)
+                log_and_report(f"Queued ESCAPE key for {function_name}", function_name)
+                return
             ActionChains(driver).send_keys(Keys.ESCAPE).perform()
             log_and_report(f"Pressed ESCAPE key for {function_name}", function_name)
         except Exception as e:
             log_and_report(f"Failed to press ESCAPE key for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def press_backspace_key(self, driver, function_name, trace, report):
-        """Send BACKSPACE key to the current browser using ActionChains."""
+    def press_backspace_key(self, driver, function_name, trace, report, defer=False):
+        """Send BACKSPACE key to the current browser using ActionChains.
+
+        With defer=True the key press is queued on the shared chain and sent by `flush_actions`.
+        """
         try:
+            if defer:
+                self.action(driver).send_keys(Keys.BACKSPACE)
+                log_and_report(f"Queued BACKSPACE key for {function_name}", function_name)
+                return
             ActionChains(driver).send_keys(Keys.BACKSPACE).perform()
             log_and_report(f"Pressed BACKSPACE key for {function_name}", function_name)
         except Exception as e:
             log_and_report(f"Failed to press BACKSPACE key for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def move_the_mouse_by_offset(self, driver, locator, x_coordinate, y_coordinate, function_name, trace, report):
-        """Move the mouse to an element then offset by x/y pixels."""
+    def move_the_mouse_by_offset(self, driver, locator, x_coordinate, y_coordinate, function_name, trace, report, defer=False):
+        """Move the mouse to an element then offset by x/y pixels.
+
+        With defer=True the move is queued on the shared chain and sent by `flush_actions`.
+        """
         try:
+            if defer:
+                self.action(driver).move_to_element(locator).move_by_offset(x_coordinate, y_coordinate)
+                log_and_report(f"Queued mouse move by offset ({x_coordinate}, {y_coordinate}) for {function_name}", function_name)
+                return
             ActionChains(driver).move_to_element(locator).move_by_offset(x_coordinate, y_coordinate).perform()
             log_and_report(f"Moved mouse by offset ({x_coordinate}, {y_coordinate}) for {function_name}", function_name)
         except Exception as e:
@@ -654,36 +1462,155 @@ class WebRunner:
             log_and_report(f"Failed to scroll to element for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def json_file_reader(self, file_path):
-        """Read and return JSON content from a file path. Returns parsed JSON or prints exception."""
+    _SCROLL_AND_READ_JS = """
+    var el = arguments[0];
+    el.scrollIntoView({ behavior: "auto", block: "center", inline: "center" });
+    var r = el.getBoundingClientRect();
+    return { text: el.innerText, rect: { x: r.x, y: r.y, width: r.width, height: r.height } };
+    """
+
+    def scroll_and_read(self, driver, locator, function_name, trace, report):
+        """Scroll an element into view and read its text and bounding rect in one round-trip.
+
+        Returns:
+            dict: {'text': str, 'rect': {'x', 'y', 'width', 'height'}} with the rect measured
+            after scrolling.
+        """
         try:
-            with open(file_path) as f:
-                data = json.load(f)
+            data = driver.execute_script(self._SCROLL_AND_READ_JS, locator)
+            log_and_report(f"Scrolled to and read text '{str(data['text'])}' for {function_name}", function_name)
             return data
+        except Exception as e:
+            log_and_report(f"Failed to scroll to and read element for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
+            pytest.fail()
+
+    def json_file_reader(self, file_path):
+        """Read and return JSON content from a file path. Returns parsed JSON or prints exception.
+
+        Parsed content is cached until the file's modification time changes, and the same object is
+        returned to every caller; copy it before mutating.
+        """
+        try:
+            return _load_json(file_path, _file_mtime(file_path))
         except Exception as e:
             print(e)
 
-    def zip_dir(self, directory, zipname):
+    def json_items(self, file_path, prefix='item'):
+        """Yield the items found under prefix in a JSON file without loading the whole document.
+
+        Parameters:
+            file_path (str): Path to a .json file, or a gzip-compressed .json.gz file.
+            prefix (str): ijson prefix of the items to yield; 'item' yields the elements of a top-level
+                array and e.g. 'users.item' the elements of the 'users' array.
+
+        Items are streamed with ijson (using its fastest installed backend, such as yajl2_c); when
+        ijson is not installed the file is parsed in full and the same items are yielded.
+        """
+        opener = gzip.open if file_path.endswith(".gz") else open
+        with opener(file_path, "rb") as f:
+            if ijson is not None:
+                yield from ijson.items(f, prefix)
+            else:
+                keys = prefix.split(".") if prefix else []
+                yield from _json_prefix_items(_json_loads(f.read()), keys)
+
+    def zip_dir(self, directory, zipname, compression=zipfile.ZIP_DEFLATED, compresslevel=6, stored_exts=(".jpg", ".jpeg", ".png", ".gif", ".zip", ".gz")):
         """Zip the contents of a directory into a zip file named zipname.
 
         The zip will contain the directory as the root folder inside the archive.
+
+        Parameters:
+            directory (str): Directory to archive.
+            zipname (str): Path of the zip file to create.
+            compression (int): zipfile compression method used for regular files.
+            compresslevel (int|None): Compression level passed to zipfile (6 is zlib's default).
+            stored_exts (tuple[str]): File extensions (lower-case) that are already compressed and
+                are stored with ZIP_STORED instead of being deflated again.
         """
 
         if os.path.exists(directory):
-            outZipFile = zipfile.ZipFile(zipname, 'w', zipfile.ZIP_DEFLATED)
+            with zipfile.ZipFile(zipname, 'w', compression, compresslevel=compresslevel) as outZipFile:
+
+                # The root directory within the ZIP file.
+                rootdir = os.path.basename(directory)
+
+                for entry in _iter_files(directory):
+                    parentpath = os.path.relpath(entry.path, directory)
+                    zinfo = zipfile.ZipInfo.from_file(entry.path, os.path.join(rootdir, parentpath))
+                    if entry.name.lower().endswith(stored_exts):
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                    else:
+                        zinfo.compress_type = compression
+                        # Same attribute ZipFile.write sets; ZipFile.open(zinfo) does not apply compresslevel itself.
+                        zinfo._compresslevel = compresslevel
+                    # Copy in 1 MiB blocks instead of ZipFile.write's 8 KiB to cut read/write calls.
+                    with open(entry.path, "rb", buffering=1 << 20) as src, outZipFile.open(zinfo, "w") as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+
+    # Installs window.__wr_drop(dropZone, fileName, blob, contentType), which wraps the blob in a File
+    # and dispatches a synthetic drop event carrying it. The drop scripts below run it first when the
+    # helper is missing, so the file payload crosses the wire in a single call.
+    _DROP_INSTALL_JS = """
+    if (!window.__wr_drop) {
+        window.__wr_drop = function (dropZone, fileName, blob, contentType) {
+            var dataTransfer = new DataTransfer();
+            dataTransfer.items.add(new File([blob], fileName, { type: contentType }));
+            dropZone.dispatchEvent(new DragEvent('drop', {
+                bubbles: true,
+                cancelable: true,
+                dataTransfer: dataTransfer
+            }));
+        };
+    }
+    """
+    _DROP_BASE64_JS = _DROP_INSTALL_JS + """
+    var bytes = Uint8Array.from(atob(arguments[1].split(',')[1]), function (c) { return c.charCodeAt(0); });
+    window.__wr_drop(arguments[3], arguments[0], new Blob([bytes], { type: arguments[2] }), arguments[2]);
+    """
 
-            # The root directory within the ZIP file.
-            rootdir = os.path.basename(directory)
+    # Async script: fetches arguments[1] and drops the response body as arguments[0]; reports true,
+    # or the error text when the fetch fails.
+    _DROP_URL_JS = _DROP_INSTALL_JS + """
+    var done = arguments[arguments.length - 1];
+    var fileName = arguments[0], contentType = arguments[2], dropZone = arguments[3];
+    var controller = new AbortController();
+    var timer = setTimeout(function () { controller.abort(); }, arguments[4]);
+    fetch(arguments[1], { signal: controller.signal })
+        .then(function (response) { return response.blob(); })
+        .then(function (blob) { clearTimeout(timer); window.__wr_drop(dropZone, fileName, blob, contentType); done(true); })
+        .catch(function (error) { clearTimeout(timer); done(String(error)); });
+    """
 
-            for dirpath, dirnames, filenames in os.walk(directory):
+    def _drop_file_from_url(self, driver, drop_zone, file_path, content_type):
+        """Drop a local file on drop_zone by letting the page fetch it from the loopback upload server.
 
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    parentpath = os.path.relpath(filepath, directory)
-                    arcname = os.path.join(rootdir, parentpath)
-                    outZipFile.write(filepath, arcname)
+        The fetch is aborted at 80% of the driver's script timeout, and at least one second before
+        it, so a slow or blocked transfer ends in the base64 fallback and never fires a late second
+        drop. A script timeout is treated as a failed fetch as well.
 
-            outZipFile.close()
+        Returns:
+            bool: True if the drop was dispatched; False if the browser could not fetch the file (for
+            example a remote Grid browser that cannot reach this machine's loopback address).
+        """
+        try:
+            script_timeout = driver.timeouts.script
+        except Exception as e:
+            script_timeout = 30
+        deadline_ms = int(min(script_timeout - 1, script_timeout * 0.8) * 1000)
+        server = _upload_server()
+        token = secrets.token_urlsafe(16)
+        _upload_files[token] = file_path
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/{token}"
+            try:
+                result = driver.execute_async_script(self._DROP_URL_JS, os.path.basename(file_path), url, content_type, drop_zone, deadline_ms)
+            except TimeoutException as e:
+                result = f"script timeout: {e}"
+            if result is not True:
+                LoggerReports.logger.info(f"Failed to fetch {file_path} from the upload server: {result}")
+            return result is True
+        finally:
+            _upload_files.pop(token, None)
 
     def upload_image_or_file(self, driver, trace, report, function_name, drop_location, file_path, file_type):
         """Upload a file or image into a web dropzone by synthesizing a drag/drop event.
@@ -695,83 +1622,65 @@ class WebRunner:
             drop_location (str): XPath to the drop target element.
             file_path (str): Local filesystem path to the file to upload.
             file_type (str): 'image' or 'json' to help set content-type header in the synthetic file.
+
+        When the drop target is, or contains, an <input type="file"> the path is sent to that input
+        directly and the file is never read or base64-encoded in Python. Otherwise the drop helper is
+        installed on the page as window.__wr_drop by the same call that sends the file data.
+        Files over 2 MiB are fetched by the page from a loopback HTTP server rather than sent as
+        base64; if the browser cannot reach it the base64 path is used instead.
         """
         try:
-            drop_zone = driver.find_element(By.XPATH, drop_location)
-            time.sleep(1)
-            file_path = file_path
+            # Presence only: the synthetic drop works on dropzones that stay hidden until a drag starts.
+            drop_zone = _wait(driver, self.timeout).until(_presence_cond(By.XPATH, drop_location))
+            file_inputs = drop_zone.find_elements(By.XPATH, "self::input[@type='file'] | .//input[@type='file']")
+            if file_inputs:
+                file_inputs[0].send_keys(os.path.abspath(file_path))
+                log_and_report(f"Uploaded file ({file_path}) through file input for {function_name}", function_name)
+                return
 
-            with open(file_path, "rb") as file:
-                file_data = file.read()
-                file_base64 = base64.b64encode(file_data).decode()
-
-            js_script = """
-                           var fileName = arguments[0];
-                           var fileDataBase64 = arguments[1];
-                           var contentType = arguments[2];
-                           var dropZone = arguments[3];
-
-                           function base64ToFile(base64, filename, contentType) {
-                               var byteString = atob(base64.split(',')[1]);
-                               var ab = new ArrayBuffer(byteString.length);
-                               var ia = new Uint8Array(ab);
-                               for (var i = 0; i < byteString.length; i++) {
-                                   ia[i] = byteString.charCodeAt(i);
-                               }
-                               var blob = new Blob([ab], { type: contentType });
-                               return new File([blob], filename, { type: contentType });
-                           }
-
-                           var file = base64ToFile(fileDataBase64, fileName, contentType);
-                           var dataTransfer = new DataTransfer();
-                           dataTransfer.items.add(file);
-
-                           var event = new DragEvent('drop', {
-                               bubbles: true,
-                               cancelable: true,
-                               dataTransfer: dataTransfer
-                           });
-
-                           dropZone.dispatchEvent(event);
-                           """
             if file_type == "image":
                 file_type = "image/jpeg"
             elif file_type == "json":
                 file_type = "application/json"
-            driver.execute_script(js_script, os.path.basename(file_path), 'data:image/jpeg;base64,' + file_base64, file_type, drop_zone)
+            if os.path.getsize(file_path) > _UPLOAD_URL_THRESHOLD and self._drop_file_from_url(driver, drop_zone, file_path, file_type):
+                log_and_report(f"Uploaded file ({file_path}) from the upload server for {function_name}", function_name)
+                return
+
+            with open(file_path, "rb") as file:
+                file_data = file.read()
+                file_base64 = base64.b64encode(file_data).decode()
+
+            driver.execute_script(self._DROP_BASE64_JS, os.path.basename(file_path), 'data:image/jpeg;base64,' + file_base64, file_type, drop_zone)
             log_and_report(f"Uploaded image to ({file_path} for {function_name}", function_name)
         except Exception as e:
             log_and_report(f"Failed to upload image/file for {function_name}", function_name, screenshot=True, driver=driver, trace=trace)
             pytest.fail()
 
-    def get_xpath_from_coordinates(self, driver, x, y):
-        """Return a rough XPath to the element located at the given client coordinates by executing JS."""
-        script = """
-        var element = document.elementFromPoint(arguments[0], arguments[1]);
-        function getPathTo(element) {
-            if (element.tagName == 'HTML') return '/HTML[1]';
-            if (element===document.body) return '/HTML[1]/BODY[1]';
-            var index = 0;
-            var siblings = element.parentNode.childNodes;
-            for (var i = 0; i < siblings.length; i++) {
-                var sibling = siblings[i];
-                if (sibling===element) {
-                    return getPathTo(element.parentNode) + '/' + element.tagName + '[' + (index+1) + ']';
-                }
-                if (sibling.nodeType===1 && sibling.tagName===element.tagName) {
-                    index++;
-                }
-            }
+    _XPATH_AT_POINT_JS = """
+    var element = document.elementFromPoint(arguments[0], arguments[1]);
+    if (!element) return null;
+    var parts = [];
+    for (var el = element; el && el.tagName !== 'HTML'; el = el.parentElement) {
+        var index = 1;
+        for (var s = el.previousElementSibling; s; s = s.previousElementSibling) {
+            if (s.tagName === el.tagName) index++;
         }
-        return getPathTo(element);
+        parts.unshift(el.tagName + '[' + index + ']');
+    }
+    return '/HTML[1]' + (parts.length ? '/' + parts.join('/') : '');
+    """
+
+    def get_xpath_from_coordinates(self, driver, x, y):
+        """Return a rough XPath to the element located at the given client coordinates by executing JS.
+
+        The path is built bottom-up in one loop, counting same-tag element siblings at each level.
         """
-        return driver.execute_script(script, x, y)
+        return driver.execute_script(self._XPATH_AT_POINT_JS, x, y)
 
-    def display_log(self, driver, message: str):
-        """Inject a floating logger DIV into the page and set its text to the provided message."""
-        script = f"""
+    _LOGGER_INSTALL_JS = """
+    window.__wrLogger = function (message) {
         let logDiv = document.getElementById('automation-logger');
-        if (!logDiv) {{
+        if (!logDiv) {
             logDiv = document.createElement('div');
             logDiv.id = 'automation-logger';
             logDiv.style.position = 'fixed';
@@ -785,54 +1694,91 @@ class WebRunner:
             logDiv.style.borderRadius = '8px';
             logDiv.style.boxShadow = '0 0 10px rgba(0,0,0,0.5)';
             document.body.appendChild(logDiv);
-        }}
-        logDiv.innerText = `{message}`;
+        }
+        logDiv.innerText = message;
+    };
+    window.__wrLogger(arguments[0]);
+    """
+    _LOGGER_UPDATE_JS = "if (!window.__wrLogger) { return false; } window.__wrLogger(arguments[0]); return true;"
+
+    def display_log(self, driver, message: str):
+        """Show the provided message in a floating logger DIV injected into the page.
+
+        The DIV factory is installed on the page once as window.__wrLogger; later calls only send
+        the short update script with the message as an argument. After a navigation the update
+        reports the logger missing and the factory is installed again. Headless sessions opened
+        through `open_browser` skip the call entirely since nobody can see the overlay.
+        """
+        if driver.session_id in WebRunner._headless_sessions:
+            return
+        if not driver.execute_script(self._LOGGER_UPDATE_JS, message):
+            driver.execute_script(self._LOGGER_INSTALL_JS, message)
+
+    def flush_failed_xpaths(self):
+        """Write the failed xpaths stored by this process since the last flush to the INI file.
+
+        Only this process's pending entries are written: under an exclusive lock on a sibling
+        .lock file the INI is re-read, the entries are merged in and the result is written to a
+        temporary sibling and moved into place. Parallel workers therefore keep each other's
+        entries, and a crash mid-write never leaves a truncated INI behind.
         """
-        driver.execute_script(script)
+        pending = WebRunner._failed_xpaths_pending
+        if not pending:
+            return
+        os.makedirs(os.path.dirname(_FAILED_XPATHS_PATH), exist_ok=True)
+        with _file_lock(_FAILED_XPATHS_PATH + ".lock"):
+            config = configparser.ConfigParser()
+            config.read(_FAILED_XPATHS_PATH)
+            for (section, key), value in pending.items():
+                if not config.has_section(section):
+                    config.add_section(section)
+                config.set(section, key, value)
+            temp_path = f"{_FAILED_XPATHS_PATH}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as file:
+                config.write(file)
+            os.replace(temp_path, _FAILED_XPATHS_PATH)
+        pending.clear()
 
     def store_failed_xpaths(self, element_value, function_name):
-        """Store a failed xpath into a local INI file, recording the failing test location.
+        """Store a failed xpath, recording the failing test location.
 
         The routine attempts to discover the calling test class and variable name that matched the
         element_value so that the stored key contains a helpful name. On any error this falls back
-        to writing into the 'Failed To Locate' section.
+        to writing into the 'Failed To Locate' section. Entries are kept in memory and written to
+        the INI file by `flush_failed_xpaths` (called from `tear_down` and at interpreter exit),
+        which creates any section the file is missing.
         """
-        global config, store_coordinates
         try:
-            store_coordinates = os.path.join(os.path.abspath(__file__ + "/../../../") + "/test_data/" + "failed_xpaths.ini")
-            config = configparser.ConfigParser()
-            config.read(store_coordinates)
-            stack = inspect.stack()
-            caller_frame = stack[2][0]
-            cls_name = stack[2][1]
+            caller_frame = sys._getframe(2)
+            cls_name = caller_frame.f_code.co_filename
             module_name = os.path.splitext(os.path.basename(cls_name))[0]
-            spec = importlib.util.spec_from_file_location(module_name, cls_name)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            var_name = ""
-            var_present = False
+            # The calling test module is already imported by pytest; only import it when it is not.
+            module = sys.modules.get(caller_frame.f_globals.get("__name__"))
+            if module is None:
+                module = _import_module_from_file(module_name, cls_name)
+            var_name = None
             try:
                 for name, obj in module.__dict__.items():
                     if isinstance(obj, type) and str(module_name) in str(obj):
-                        class_attributes = obj.__dict__
-                        for var_name, val in class_attributes.items():
-                            if val == element_value and "__" not in var_name and "__" not in val:
-                                var_present = True
-                                break
+                        var_name = _value_to_var(obj).get(element_value)
+                        if var_name is not None:
+                            break
             except:
                 pass
+            var_present = var_name is not None
             class_name = caller_frame.f_locals['self'].__class__.__name__
             if var_present:
                 function_name = f"{class_name}.{function_name}.{var_name}"
             else:
                 function_name = f"{class_name}.{function_name}"
-            config["Failed XPaths"][function_name] = f"{element_value}"
-            with open(store_coordinates, "w") as file:
-                config.write(file)
+            WebRunner._failed_xpaths_pending["Failed XPaths", function_name] = f"{element_value}"
             print(f"stored failed xpath: {element_value}")
         except Exception as e:
-            config["Failed To Locate"]["failed_to_locate"] = f"{element_value}"
-            with open(store_coordinates, "w") as file:
-                config.write(file)
+            WebRunner._failed_xpaths_pending["Failed To Locate", "failed_to_locate"] = f"{element_value}"
             print(f"failed to failed xpath for {element_value}")
             print(e)
+
+
+atexit.register(_quit_pooled_drivers)
+atexit.register(_flush_failed_xpaths_at_exit)
+atexit.register(_SCREENSHOT_POOL.shutdown)